@@ -1,1038 +1,1319 @@
-# game_view.py - Fixed syntax error on line 199
-import gc
-import os
-import base64
-from pathlib import Path
-from datetime import datetime
+# game_view.py - Fixed syntax error on line 199
+import gc
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from datetime import datetime
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import QToolTip
 from PyQt6.QtGui import QCursor
-from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings, QWebEngineScript
-from PyQt6.QtCore import Qt, QUrl, QDir, pyqtSignal, QTimer, QEvent
-try:
-    from zoneinfo import ZoneInfo
-except Exception:
-    ZoneInfo = None
-import config
-
-
-def _is_lostcity_game_client_url(qurl):
-    """Return True if the given QUrl points at the LostCity game client (world rs2.cgi or base /client)."""
-    try:
-        if not qurl or not qurl.isValid():
-            return False
-        host = (qurl.host() or "").lower()
-        path = (qurl.path() or "").lower()
-        # Base client page
-        if host == "2004.lostcity.rs" and path.startswith("/client"):
-            return True
-        # World servers like w2-2004.lostcity.rs running the game under /rs2.cgi
-        if host.endswith("-2004.lostcity.rs"):
-            # Prefix like w2, w3, etc.
-            prefix = host.split("-", 1)[0]
-            if prefix.startswith("w") and path.startswith("/rs2.cgi"):
-                return True
-        return False
-    except Exception:
-        return False
-
-
-class GamePage(QWebEnginePage):
-    """Custom page that blocks back/forward navigation on protected URLs."""
-
-    def __init__(self, profile, parent=None):
-        super().__init__(profile, parent)
-        self._blocked_back_patterns = []
-        self._screenshot_handler = None
-        self._click_log_handler = None
-
-    def set_blocked_back_patterns(self, patterns):
-        self._blocked_back_patterns = [pattern.lower() for pattern in patterns or []]
-
-    def set_screenshot_handler(self, handler):
-        self._screenshot_handler = handler
-
-    def set_click_log_handler(self, handler):
-        self._click_log_handler = handler
-
-    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
-        try:
-            if url.scheme().lower() == "lostkit":
-                target = url.host() or url.path().lstrip("/")
-                if target and target.lower().startswith("take-screenshot"):
-                    if callable(self._screenshot_handler):
-                        self._screenshot_handler()
-                    return False
-        except Exception as e:
-            print(f"Error handling custom navigation: {e}")
-
-        if (nav_type == QWebEnginePage.NavigationType.NavigationTypeBackForward and
-                self._should_block_back_forward()):
-            print("Blocked back/forward navigation while on LostCity client.")
-            return False
-        return super().acceptNavigationRequest(url, nav_type, is_main_frame)
-
-    def triggerAction(self, action, checked=False):
-        """Block Back action while on the game client, as an extra safeguard."""
-        try:
-            if action == QWebEnginePage.WebAction.Back and self._should_block_back_forward():
-                print("Blocked Back web action while on LostCity client.")
-                return
-        except Exception:
-            pass
-        return super().triggerAction(action, checked)
-
-    # Capture console logs from JS and forward special click markers
-    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
-        try:
-            if isinstance(message, str) and message.startswith('@@CLICK@@ '):
-                payload = message[len('@@CLICK@@ '):]
-                if callable(self._click_log_handler):
-                    self._click_log_handler(payload)
-        except Exception as e:
-            print(f"Error processing click console message: {e}")
-        # Also print all console messages for visibility
-        try:
-            print(f"JS[{level}] {sourceID}:{lineNumber}: {message}")
-        except Exception:
-            pass
-        try:
-            return super().javaScriptConsoleMessage(level, message, lineNumber, sourceID)
-        except Exception:
-            # Some bindings may not require calling super
-            return None
-
-    def _should_block_back_forward(self):
-        try:
-            view = self.view()
-            if view is None:
-                return False
-            current = view.url()
-            if not current.isValid():
-                return False
-            # Block for known game client URLs OR any configured static prefixes
-            if _is_lostcity_game_client_url(current):
-                return True
-            current_str = current.toString().lower()
-            return any(current_str.startswith(pattern) for pattern in self._blocked_back_patterns)
-        except Exception as e:
-            print(f"Error checking back navigation: {e}")
-            return False
-
-
-class GameViewWidget(QWebEngineView):
-    zoom_changed = pyqtSignal(float)
-    screenshot_requested = pyqtSignal()
-    
+from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings, QWebEngineScript
+try:
+    from PyQt6.QtWebEngineCore import QWebEngineDownloadRequest as _DownloadItem
+except ImportError:
+    _DownloadItem = None
+from PyQt6.QtCore import (Qt, QUrl, QDir, pyqtSignal, QTimer, QEvent,
+                          QCoreApplication, QByteArray, QFile)
+try:
+    from zoneinfo import ZoneInfo
+except Exception:
+    ZoneInfo = None
+import config
+
+# Module logger: debug-level diagnostics are a near-free no-op unless a
+# handler opts in, unlike print() which always formats, locks stdio and
+# flushes — noticeable on the navigation/event hot paths
+logger = logging.getLogger(__name__)
+
+# Only force a collection when gen-2 has grown by this many tracked objects
+# since the last sweep, or when this much time has passed without one.
+# Growth is measured with len(gc.get_objects(2)) — gc.get_count()[2] counts
+# gen-1 collections, not objects, and with the raised thresholds from main.py
+# it would practically never reach a meaningful delta. Unconditional
+# gc.collect() on a timer causes visible stalls in the Qt event loop.
+_GC_GEN2_GROWTH_THRESHOLD = 500
+_GC_MAX_WAIT_SECONDS = 900
+
+
+def _gen2_size():
+    """Number of objects currently tracked in the collector's oldest generation."""
+    try:
+        return len(gc.get_objects(2))
+    except Exception:
+        return 0
+
+# Timestamp helpers resolved once at import: the LostCity timezone and the
+# platform's strftime directive for numbers without a leading zero
+# (glibc/macOS use "-", Windows uses "#").
+try:
+    _NY_TZ = ZoneInfo("America/New_York") if ZoneInfo is not None else None
+except Exception:
+    _NY_TZ = None
+_TS_FORMAT = ("%B-%#d-%Y-%#I-%M-%S-%p" if os.name == "nt"
+              else "%B-%-d-%Y-%-I-%M-%S-%p")
+
+# Screenshot target directory next to this file; resolved and created once
+# so the capture paths don't re-stat and re-mkdir on every screenshot
+_SCREENSHOTS_DIR = Path(__file__).resolve().parent / "LCScreenshots"
+try:
+    _SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+except Exception as e:
+    logger.warning("Could not create screenshots directory: %s", e)
+
+# Click-log target resolved once at import for the same reason; the
+# directory itself is only created when a log file is actually opened.
+_CLICK_LOG_PATH = Path(__file__).resolve().parent / "logs" / "clicks.jsonl"
+
+# The download-item API differs between Qt generations; detect the variant
+# once at import instead of hasattr-probing every download object.
+_DOWNLOAD_QT6_API = _DownloadItem is not None and hasattr(_DownloadItem, "setDownloadDirectory")
+
+
+def _apply_download_path(download, target_dir, filename):
+    """Route a download to target_dir/filename using the detected API variant."""
+    if _DOWNLOAD_QT6_API:
+        download.setDownloadDirectory(target_dir)
+        download.setDownloadFileName(filename)
+        download.accept()
+        return True
+    if hasattr(download, "setPath"):
+        # PyQt5 style
+        download.setPath(os.path.join(target_dir, filename))
+        download.accept()
+        return True
+    return False
+
+
+def _lc_timestamp():
+    """LostCity-style timestamp (New York time) for screenshot filenames."""
+    try:
+        now = datetime.now(_NY_TZ) if _NY_TZ is not None else datetime.now()
+        return f"{now.strftime(_TS_FORMAT)}-{now.tzname() or 'EDT'}"
+    except Exception:
+        return datetime.now().strftime("%B-%d-%Y-%I-%M-%S-%p-EDT")
+
+
+def _on_download_requested(download):
+    """Force game-initiated downloads (e.g. screenshots) into LCScreenshots.
+
+    Connected once per profile in _get_or_create_profile. The handler is
+    module-level on purpose: the profile lives for the application's
+    lifetime, and a widget-bound receiver would be silently dropped by Qt
+    if that widget were destroyed, leaving downloads unredirected.
+    """
+    try:
+        target_dir = _SCREENSHOTS_DIR
+
+        # Best-effort read suggested name and extension; the API variant
+        # was detected once at import
+        suggested = None
+        try:
+            if _DOWNLOAD_QT6_API:
+                suggested = download.downloadFileName()
+            elif hasattr(download, 'path'):
+                suggested = download.path()
+            if not suggested:
+                suggested = download.url().fileName()  # fallback
+        except Exception:
+            suggested = None
+
+        # Normalize extension
+        ext = ".png"
+        try:
+            if suggested:
+                base = os.path.basename(str(suggested))
+                suffix = os.path.splitext(base)[1]
+                if suffix:
+                    ext = suffix
+        except Exception:
+            pass
+
+        filename = f"LC_{_lc_timestamp()}{ext}"
+
+        # Apply target path according to the API variant detected at import
+        applied = False
+        try:
+            applied = _apply_download_path(download, str(target_dir), filename)
+        except Exception as e:
+            logger.warning("Download redirection failed: %s", e)
+
+        if applied:
+            logger.debug("Redirected download to %s as %s", target_dir, filename)
+            try:
+                if config.get_config_value("screenshot_toast_enabled", True):
+                    QToolTip.showText(QCursor.pos(),
+                                      f"Screenshot saved\n{target_dir / filename}")
+            except Exception:
+                pass
+        else:
+            logger.warning("Could not apply download redirection; download may go to default location.")
+    except Exception as e:
+        logger.warning("Error in download handler: %s", e)
+
+
+# Shared web engine profiles keyed by name. Profile construction is heavy
+# (it spins up a network stack and loads the disk-cache index), so each
+# profile is built once, parented to the application, and reused by every
+# GameViewWidget instead of being recreated per widget.
+_PROFILE_CACHE = {}
+
+# Static tables computed once at import so per-instance and per-event code
+# doesn't rebuild them.
+_NAV_BUTTONS = frozenset(
+    btn for btn in (
+        getattr(Qt.MouseButton, name, None)
+        for name in ("BackButton", "ForwardButton", "XButton1", "XButton2")
+    ) if btn is not None
+)
+
+_BLOCKED_BACK_PATTERNS_DEFAULT = ("https://2004.lostcity.rs/client",)
+
+# Settings applied to the shared game profile: performance optimizations
+# plus everything the game and login flows need.
+_GAME_SETTINGS = (
+    # Enable hardware acceleration and GPU features for game
+    (QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True),
+    (QWebEngineSettings.WebAttribute.WebGLEnabled, True),
+    # Essential features for game and login functionality
+    (QWebEngineSettings.WebAttribute.JavascriptEnabled, True),
+    (QWebEngineSettings.WebAttribute.LocalStorageEnabled, True),
+    (QWebEngineSettings.WebAttribute.AutoLoadImages, True),
+    (QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False),
+    (QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, True),
+    (QWebEngineSettings.WebAttribute.FocusOnNavigationEnabled, True),
+    # Disable only non-essential features
+    (QWebEngineSettings.WebAttribute.PluginsEnabled, False),
+)
+
+# Extra settings applied only when resource_optimization is enabled
+_RESOURCE_OPT_SETTINGS = (
+    (QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, False),
+    (QWebEngineSettings.WebAttribute.TouchIconsEnabled, False),
+)
+
+
+def _get_or_create_profile(name, cfg=None):
+    """Return the shared QWebEngineProfile for name, configuring it on first use.
+
+    cfg is an already-loaded config dict so first-time setup doesn't re-read
+    the config file for each key it consults.
+    """
+    profile = _PROFILE_CACHE.get(name)
+    if profile is not None:
+        return profile
+    if cfg is None:
+        cfg = config.load_config()
+
+    profile = QWebEngineProfile(name, QCoreApplication.instance())
+
+    # Use persistent directories that survive application restarts
+    cache_path = config.get_persistent_cache_path("game_cache")
+    storage_path = config.get_persistent_profile_path("game_profile")
+
+    cache_dir = QDir(cache_path)
+    if not cache_dir.exists():
+        cache_dir.mkpath(".")
+    storage_dir = QDir(storage_path)
+    if not storage_dir.exists():
+        storage_dir.mkpath(".")
+
+    logger.debug("Game using persistent cache: %s", cache_path)
+    logger.debug("Game using persistent storage: %s", storage_path)
+
+    profile.setCachePath(cache_path)
+    profile.setPersistentStoragePath(storage_path)
+
+    # Bound the on-disk HTTP cache: Chromium's default scales with free disk
+    # space, and an unbounded cache slows the index load at profile startup
+    profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+    try:
+        max_cache_bytes = int(cfg.get("http_cache_max_bytes", 128 * 1024 * 1024))
+    except Exception:
+        max_cache_bytes = 128 * 1024 * 1024
+    profile.setHttpCacheMaximumSize(max_cache_bytes)
+
+    # Force persistent cookies
+    profile.setPersistentCookiesPolicy(
+        QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
+    )
+
+    # Route all downloads (e.g., game client screenshots) to LCScreenshots.
+    # The receiver is module-level so it matches the profile's lifetime;
+    # see _on_download_requested.
+    profile.downloadRequested.connect(_on_download_requested)
+
+    # Performance optimizations but keep all login-related features
+    settings = profile.settings()
+    for attr, value in _GAME_SETTINGS:
+        settings.setAttribute(attr, value)
+    if cfg.get("resource_optimization", True):
+        for attr, value in _RESOURCE_OPT_SETTINGS:
+            settings.setAttribute(attr, value)
+
+    _PROFILE_CACHE[name] = profile
+    return profile
+
+
+def _minify_js(source):
+    """Strip comment-only lines and indentation from injected JS.
+
+    Runs once at import on each source constant below, so every injection
+    and per-capture runJavaScript call hands the page parser the smaller
+    form without paying for the strip again.
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+# Sources for the injected page scripts (see install_boot_script). Every
+# injected QWebEngineScript costs a V8 compile per frame at load, so the
+# console filter and screenshot hook ship as one MainWorld script; the click
+# logger runs in its own ApplicationWorld script so its closures and buffers
+# stay out of the page's world. All are held in module constants so no
+# method rebuilds the strings per call.
+
+# Wrap console.log so only '@@' marker messages survive; everything else is
+# dropped before it crosses the renderer->browser IPC boundary.
+_CONSOLE_FILTER_JS = _minify_js("""
+(function(){
+    'use strict';
+    var _log = console.log;
+    console.log = function(m){
+        if (typeof m === 'string' && m.charCodeAt(0) === 64 && m.charCodeAt(1) === 64) {
+            _log.apply(console, arguments);
+        }
+    };
+})();
+""")
+
+_SCREENSHOT_HOOK_JS = _minify_js("""
+(function() {
+    'use strict';
+    const CUSTOM_URL = 'lostkit://take-screenshot';
+    // Match needles hoisted once; the label is 15 chars, so anything with
+    // long textContent can be rejected on length before any lowercasing
+    const NEEDLE_TEXT = 'take screenshot';
+    const NEEDLE_OC = 'savescreenshot';
+    const MAX_LABEL_LEN = 64;
+
+    function triggerLostKit() {
+        try { window.location.href = CUSTOM_URL; } catch (err) {}
+    }
+
+    function overrideSaveScreenshot() {
+        try {
+            window.saveScreenshot = function() { triggerLostKit(); return undefined; };
+            window.saveScreenshot.__lostkitWrapped = true;
+        } catch (e) {}
+    }
+
+    function overrideCandidates() {
+        ['takeScreenshot','take_screenshot','TakeScreenshot'].forEach(function(name){
+            try { window[name] = function(){ triggerLostKit(); return undefined; }; } catch (e) {}
+        });
+    }
+
+    function cacheCanvas() {
+        try {
+            var c = document.getElementById('canvas');
+            if (c) {
+                window.__lkCanvas = c;
+                // Publish to the top window (same-origin only)
+                // so the capture script never walks frames
+                try { if (window.top !== window) { window.top.__lkCanvas = c; } } catch (e) {}
+                return;
+            }
+        } catch (e) {}
+        setTimeout(cacheCanvas, 500);
+    }
+
+    // One capture-phase listener replaces the per-element attach walk and
+    // the MutationObserver entirely: the screenshot intent is recognized
+    // at click time with a few cheap checks on the clicked element, so
+    // there are no DOM scans and no per-mutation work at all.
+    document.addEventListener('click', function(ev){
+        var t = ev.target;
+        if (!t || !t.closest) { return; }
+        var el = t.closest('#screenshot,[onclick],a,button,span,div');
+        if (!el) { return; }
+        var hit = el.id === 'screenshot';
+        if (!hit) {
+            try {
+                hit = String(el.getAttribute('onclick')||'').toLowerCase().indexOf(NEEDLE_OC) !== -1;
+            } catch (e) {}
+        }
+        if (!hit) {
+            try {
+                var txt = el.textContent || '';
+                hit = txt.length <= MAX_LABEL_LEN && txt.trim().toLowerCase() === NEEDLE_TEXT;
+            } catch (e) {}
+        }
+        if (!hit) { return; }
+        try { ev.preventDefault(); } catch (e) {}
+        try { ev.stopImmediatePropagation(); } catch (e) {}
+        triggerLostKit();
+    }, true);
+
+    function install() {
+        overrideSaveScreenshot();
+        overrideCandidates();
+        cacheCanvas();
+    }
+
+    // Injected at DocumentCreation: the DOM root may not exist yet, so
+    // defer the window overrides and canvas cache until it does.
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', install);
+    } else {
+        install();
+    }
+})();
+""")
+
+_CLICK_LOGGER_JS = _minify_js("""
+(function(){
+  'use strict';
+  if (window.__lostkitClickLoggerInstalled) return;
+  window.__lostkitClickLoggerInstalled = true;
+  // Runtime gate, togglable from Python without reinstalling the script;
+  // when off, the click handler bails before building any payload
+  if (window.__lostkitClickLogEnabled === undefined) {
+    window.__lostkitClickLogEnabled = true;
+  }
+
+  function isScreenshotElement(el){
+    try {
+      if (!el) return false;
+      if (el.getAttribute && el.getAttribute('data-lostkit-screenshot') === '1') return true;
+      const id = (el.id||'').toLowerCase();
+      if (id === 'screenshot') return true;
+      // Length-gate before lowercasing: big containers can't be the label
+      const txtRaw = el.textContent || '';
+      if (txtRaw.length <= 64) {
+        const txt = txtRaw.trim().toLowerCase();
+        if (txt === 'take screenshot' || txt.indexOf('screenshot') !== -1) return true;
+      }
+      const oc = String((el.getAttribute && el.getAttribute('onclick'))||'').toLowerCase();
+      if (oc.indexOf('savescreenshot') !== -1) return true;
+    } catch (e) {}
+    return false;
+  }
+
+  function nodeLabel(n){
+    try {
+      if (!n || !n.tagName) return 'UNKNOWN';
+      if (!n.id && !n.className) return n.tagName.toLowerCase();
+      let s = n.tagName.toLowerCase();
+      if (n.id) s += '#' + n.id;
+      if (n.className && typeof n.className === 'string') s += '.' + n.className.trim().split(/\\s+/).slice(0,4).join('.');
+      return s;
+    } catch (e) { return 'UNKNOWN'; }
+  }
+
+  function buildPath(ev){
+    try {
+      const p = (ev.composedPath && ev.composedPath()) || [];
+      if (p && p.length) return p.map(nodeLabel).slice(0,12);
+    } catch (e) {}
+    // Fallback: simple parent chain
+    try {
+      const arr = []; let cur = ev.target; let i=0;
+      while (cur && i++ < 12) { arr.push(nodeLabel(cur)); cur = cur.parentNode; }
+      return arr;
+    } catch (e) { return []; }
+  }
+
+  function trim(s, n){ try { s = String(s||''); return s.length>n ? s.slice(0,n) : s; } catch(e){ return ''; } }
+
+  // Batch clicks over a short window so each IPC hop to
+  // Python carries an array instead of one message per click
+  var _buf = [], _t = null;
+  // Dedupe state: game UIs can fire synthetic duplicate clicks
+  // (mousedown-triggered plus bubbled) for one user action
+  var _lastX = 0, _lastY = 0, _lastT = 0;
+  function flush(){
+    if (_buf.length) {
+      try { console.log('@@CLICK@@ ' + JSON.stringify(_buf)); } catch (e) {}
+      _buf = [];
+    }
+    _t = null;
+  }
+  function push(p){
+    _buf.push(p);
+    if (!_t) { _t = setTimeout(flush, 250); }
+  }
+
+  document.addEventListener('click', function(ev){
+    if (!window.__lostkitClickLogEnabled) return;
+    try {
+      // Drop near-duplicates (within 50 ms and ~3 px of the previous
+      // click) before any payload is built or serialized
+      const now = Date.now();
+      if (now - _lastT < 50 &&
+          Math.abs(ev.clientX - _lastX) < 3 &&
+          Math.abs(ev.clientY - _lastY) < 3) return;
+      _lastX = ev.clientX; _lastY = ev.clientY; _lastT = now;
+      const t = ev.target;
+      // Gameplay clicks land on the canvas constantly; log those with a
+      // minimal payload and skip the path walk and attribute reads. The
+      // key set and order match the full payload below so every entry
+      // shares one hidden class and stringify stays monomorphic.
+      if (t && t.tagName === 'CANVAS' && !isScreenshotElement(t)) {
+        push({ ts: now, type: 'click', pageUrl: '',
+               clientX: ev.clientX||0, clientY: ev.clientY||0,
+               target: { tag: 'canvas', id: '', class: '', text: '', href: '', onclick: '' },
+               path: [], isScreenshotIntent: false });
+        return;
+      }
+      const href = (t && t.getAttribute && t.getAttribute('href')) || '';
+      const onclick = (t && t.getAttribute && t.getAttribute('onclick')) || '';
+      const intent = isScreenshotElement(t);
+      const payload = {
+        ts: now,
+        type: 'click',
+        pageUrl: String(location.href||''),
+        clientX: ev.clientX||0,
+        clientY: ev.clientY||0,
+        target: {
+          tag: (t && t.tagName ? t.tagName.toLowerCase() : 'unknown'),
+          id: (t && t.id) || '',
+          class: (t && typeof t.className==='string' ? t.className : ''),
+          text: trim((t && t.textContent) || '', 120),
+          href: href || '',
+          onclick: trim(onclick, 160)
+        },
+        // The ancestor walk only pays off for screenshot-intent clicks (or
+        // when debugging); ordinary clicks ship an empty path
+        path: (intent || window.__lostkitDebugClicks) ? buildPath(ev) : [],
+        isScreenshotIntent: intent
+      };
+      push(payload);
+    } catch (e) {
+      try { push({ ts: Date.now(), err: String(e) }); } catch (ee) {}
+    }
+  }, true);
+})();
+""")
+
+# One-line canvas capture sent on every screenshot; kept as a constant so
+# runJavaScript receives the same pre-minified string each time.
+_CANVAS_CAPTURE_JS = _minify_js("""
+(function(){
+    'use strict';
+    try {
+        var c = window.__lkCanvas || document.getElementById('canvas');
+        if (!c) { return '__ERR__:no-canvas'; }
+        var data = c.toDataURL('image/png');
+        if (!data || data.indexOf('data:') !== 0) { return '__ERR__:no-dataurl'; }
+        return data;
+    } catch (e) {
+        return '__ERR__:'+ (e && e.toString ? e.toString() : 'unknown');
+    }
+})();
+""")
+
+
+# World servers look like w2-2004.lostcity.rs; matching the whole host with
+# one precompiled regex replaces the endswith/split/startswith chain the
+# per-event URL check used to run.
+_WORLD_HOST_RE = re.compile(r'\Aw[0-9]+-2004\.lostcity\.rs\Z')
+
+
+@lru_cache(maxsize=64)
+def _match_client_host_path(host, path):
+    """Match a lowercased (host, path) pair against the known client URLs.
+
+    Memoized: navigation bounces between a handful of URLs, so repeat
+    checks for the same pair are a dict hit instead of a regex match.
+    """
+    # Base client page
+    if host == "2004.lostcity.rs":
+        return path.startswith("/client")
+    # World servers run the game under /rs2.cgi
+    if _WORLD_HOST_RE.match(host):
+        return path.startswith("/rs2.cgi")
+    return False
+
+
+def _is_lostcity_game_client_url(qurl):
+    """Return True if the given QUrl points at the LostCity game client (world rs2.cgi or base /client)."""
+    try:
+        if not qurl or not qurl.isValid():
+            return False
+        return _match_client_host_path((qurl.host() or "").lower(),
+                                       (qurl.path() or "").lower())
+    except Exception:
+        return False
+
+
+class GamePage(QWebEnginePage):
+    """Custom page that blocks back/forward navigation on protected URLs."""
+
+    def __init__(self, profile, parent=None):
+        super().__init__(profile, parent)
+        self._blocked_back_re = None
+        self._screenshot_handler = None
+        self._click_log_handler = None
+        # URL-derived state recomputed only on navigation, so the per-event
+        # checks below are plain attribute reads
+        self._current_url_lc = ""
+        self._is_client_url = False
+        self._blocked_back_hit = False
+        # Marker prefix resolved once so the console callback compares
+        # against a cached attribute instead of rebuilding the literal
+        self._click_prefix = '@@CLICK@@ '
+        self._click_prefix_len = len(self._click_prefix)
+        # Optional buffered console echo (off by default); see set_console_echo
+        self._console_echo = False
+        self._echo_buf = None
+        self._echo_timer = None
+        self._echo_pool = None
+        self.urlChanged.connect(self._on_url_changed)
+
+    def _on_url_changed(self, qurl):
+        if qurl.isValid():
+            self._current_url_lc = qurl.toString().lower()
+            self._is_client_url = _is_lostcity_game_client_url(qurl)
+        else:
+            self._current_url_lc = ""
+            self._is_client_url = False
+        self._refresh_blocked_back_hit()
+
+    def _refresh_blocked_back_hit(self):
+        # Precompute the prefix match so the back/forward check is a pure
+        # attribute read; only navigation or a pattern change can alter it
+        blocked_re = self._blocked_back_re
+        self._blocked_back_hit = (blocked_re is not None and
+                                  blocked_re.match(self._current_url_lc) is not None)
+
+    def set_blocked_back_patterns(self, patterns):
+        # Compile the prefixes into one anchored alternation so the match on
+        # navigation is a single C-level regex step regardless of pattern count
+        patterns = tuple(pattern.lower() for pattern in patterns or ())
+        if patterns:
+            self._blocked_back_re = re.compile(
+                '|'.join(re.escape(pattern) for pattern in patterns))
+        else:
+            self._blocked_back_re = None
+        self._refresh_blocked_back_hit()
+
+    def set_screenshot_handler(self, handler):
+        self._screenshot_handler = handler
+
+    def set_click_log_handler(self, handler):
+        self._click_log_handler = handler
+
+    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+        # QUrl normalizes schemes to lowercase, so one equality check is the
+        # whole fast path; http/https requests never touch the host/path
+        # string handling below
+        if url.scheme() == "lostkit":
+            target = url.host() or url.path().lstrip("/")
+            if target and target.lower().startswith("take-screenshot"):
+                if callable(self._screenshot_handler):
+                    self._screenshot_handler()
+                return False
+
+        if (nav_type == QWebEnginePage.NavigationType.NavigationTypeBackForward and
+                self._should_block_back_forward()):
+            logger.debug("Blocked back/forward navigation while on LostCity client.")
+            return False
+        return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+
+    def triggerAction(self, action, checked=False):
+        """Block Back action while on the game client, as an extra safeguard."""
+        # _should_block_back_forward is two attribute reads and can't raise
+        if action == QWebEnginePage.WebAction.Back and self._should_block_back_forward():
+            logger.debug("Blocked Back web action while on LostCity client.")
+            return
+        return super().triggerAction(action, checked)
+
+    # Forward click markers from the page console. The injected console
+    # filter (part of the boot script) drops everything without a '@@'
+    # prefix on the JS side, so the renderer->browser IPC hop and this
+    # callback only happen for LostKit marker messages; the fast path here
+    # is a single slice compare against the cached prefix.
+    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
+        if message[:self._click_prefix_len] == self._click_prefix:
+            if callable(self._click_log_handler):
+                try:
+                    self._click_log_handler(message[self._click_prefix_len:])
+                except Exception as e:
+                    logger.warning("Error processing click console message: %s", e)
+            return
+        if self._console_echo:
+            # Hot path is just a deque append; the actual write happens in
+            # one batch per flush interval off the GUI thread
+            self._echo_buf.append(f"JS[{level}] {sourceID}:{lineNumber}: {message}\n")
+
+    def set_console_echo(self, enabled, io_pool=None):
+        """Enable buffered echoing of surviving console messages.
+
+        Debug aid gated by the js_console_echo config key: messages are
+        appended to a bounded deque and drained at 10 Hz into a single
+        os.write, via io_pool when one is supplied so the GUI thread never
+        blocks on stderr.
+        """
+        self._console_echo = bool(enabled)
+        if not self._console_echo:
+            return
+        self._echo_buf = deque(maxlen=4096)
+        self._echo_pool = io_pool
+        self._echo_timer = QTimer(self)
+        self._echo_timer.setInterval(100)
+        self._echo_timer.timeout.connect(self._flush_console_echo)
+        self._echo_timer.start()
+
+    def _flush_console_echo(self):
+        buf = self._echo_buf
+        if not buf:
+            return
+        lines = []
+        while buf:
+            try:
+                lines.append(buf.popleft())
+            except IndexError:
+                break
+        data = ''.join(lines).encode('utf-8', 'replace')
+        try:
+            if self._echo_pool is not None:
+                self._echo_pool.submit(os.write, 2, data)
+            else:
+                os.write(2, data)
+        except Exception:
+            pass
+
+    def _should_block_back_forward(self):
+        # Block for known game client URLs OR any configured static prefixes;
+        # both are precomputed on navigation
+        return self._is_client_url or self._blocked_back_hit
+
+
+class GameViewWidget(QWebEngineView):
+    zoom_changed = pyqtSignal(float)
+    screenshot_requested = pyqtSignal()
+    # Emitted from worker threads after a screenshot hits disk; the queued
+    # connection hops the toast back onto the GUI thread
+    _screenshot_saved = pyqtSignal(str)
+    
     def __init__(self, url, parent=None):
         super().__init__(parent)
 
+        # Cached nav-lock state; recomputed only when the URL changes so the
+        # per-event checks stay cheap
+        self._nav_locked = False
+        self._last_seen_url = None
+
+        # Unconditional defaults so closeEvent, the zoom API, and the
+        # toast/click-log paths never need hasattr/getattr probing, even if
+        # init fails partway
+        self.click_logging_enabled = True
+        self.click_log_to_file = True
+        self.screenshot_hotkey_enabled = True
+        self.screenshot_toast_enabled = True
+        self.screenshot_toast_ms = 2000
+        self._resource_opt = False
+        self.zoom_factor = 1.0
+        self._applied_zoom = None
+        self._zoom_cache = (None, "100%")
+        self.cache_path = None
+        self.storage_path = None
+        self.cleanup_timer = None
+        self._io_pool = None
+        self._zoom_save_timer = None
+        self._start_url = None
+        self._click_log_buf = []
+        self._click_log_timer = None
+        self._click_log_fd = None
+
         try:
-            # Feature toggles from config
-            self.click_logging_enabled = bool(config.get_config_value("click_logging_enabled", True))
-            self.click_log_to_file = bool(config.get_config_value("click_log_to_file", True))
-            self.screenshot_hotkey_enabled = bool(config.get_config_value("screenshot_hotkey_enabled", True))
-            self.screenshot_toast_enabled = bool(config.get_config_value("screenshot_toast_enabled", True))
+            # Feature toggles from config, fetched in a single read instead of
+            # one load per key
+            cfg = config.load_config()
+            self.click_logging_enabled = bool(cfg.get("click_logging_enabled", True))
+            self.click_log_to_file = bool(cfg.get("click_log_to_file", True))
+            self.screenshot_hotkey_enabled = bool(cfg.get("screenshot_hotkey_enabled", True))
+            self.screenshot_toast_enabled = bool(cfg.get("screenshot_toast_enabled", True))
+            self._resource_opt = bool(cfg.get("resource_optimization", True))
             try:
-                self.screenshot_toast_ms = int(config.get_config_value("screenshot_toast_ms", 2000))
+                self.screenshot_toast_ms = int(cfg.get("screenshot_toast_ms", 2000))
             except Exception:
                 self.screenshot_toast_ms = 2000
-            # Use persistent profile that survives application restarts
-            profile_name = "LostCityGame"  # Fixed name, no process ID
-            
-            profile = QWebEngineProfile(profile_name, self)
-            
-            # Use persistent directories that survive application restarts
-            cache_path = config.get_persistent_cache_path("game_cache")
-            storage_path = config.get_persistent_profile_path("game_profile")
-
-            cache_dir = QDir(cache_path)
-            if not cache_dir.exists():
-                cache_dir.mkpath(".")
-            storage_dir = QDir(storage_path)
-            if not storage_dir.exists():
-                storage_dir.mkpath(".")
-            
-            print(f"Game using persistent cache: {cache_path}")
-            print(f"Game using persistent storage: {storage_path}")
-            
-            profile.setCachePath(cache_path)
-            profile.setPersistentStoragePath(storage_path)
-            
-            # Force persistent cookies
-            profile.setPersistentCookiesPolicy(
-                QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
-            )
-            
-            # Performance optimizations but keep all login-related features
-            settings = profile.settings()
-            
-            # Enable hardware acceleration and GPU features for game
-            settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
-            
-            # Essential features for game and login functionality
-            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.FocusOnNavigationEnabled, True)
-            
-            # Disable only non-essential features
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
-            if config.get_config_value("resource_optimization", True):
-                settings.setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, False)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.TouchIconsEnabled, False)
-
-            page = GamePage(profile, self)
-            page.set_blocked_back_patterns(
-                ["https://2004.lostcity.rs/client"]
-            )
+            # Use persistent profile that survives application restarts,
+            # shared across all game views (see _get_or_create_profile)
+            profile = _get_or_create_profile("LostCityGame", cfg)
+
+            page = GamePage(profile, self)
+            page.set_blocked_back_patterns(_BLOCKED_BACK_PATTERNS_DEFAULT)
             page.set_screenshot_handler(self.handle_screenshot_request)
             if self.click_logging_enabled:
                 page.set_click_log_handler(self._handle_click_log)
-            # QWebEnginePage has no setView() in PyQt6; binding to the view is done via setPage()
-            self.setPage(page)
-
-            # Route all downloads (e.g., game client screenshots) to LCScreenshots
-            try:
-                profile.downloadRequested.connect(self.on_download_requested)
-            except Exception as e:
-                print(f"Warning: Could not connect downloadRequested: {e}")
-            
-            # Store paths for cleanup (but don't delete persistent data)
-            self.cache_path = cache_path
-            self.storage_path = storage_path
-
-            # Load the game
-            self.setUrl(QUrl(url))
-
-            # Load zoom factor from config
-            self.zoom_factor = config.get_config_value("zoom_factor", 1.0)
-            self.setZoomFactor(self.zoom_factor)
-
-            # Install screenshot hook script to run on all frames
-            self.install_screenshot_script()
-            # Install click logger across all frames (if enabled)
-            if self.click_logging_enabled:
-                self.install_click_logger_script()
-
-            # Connect signals
-            self.page().loadFinished.connect(self.on_load_finished)
-            try:
-                self.urlChanged.connect(self._on_url_changed)
-            except Exception:
-                pass
-            
-            # Enable focus for keyboard events
-            self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-            
-            # Setup cleanup timer (but preserve persistent data)
-            self.cleanup_timer = QTimer(self)
-            self.cleanup_timer.timeout.connect(self.perform_cleanup)
-            cleanup_interval = config.get_config_value("cache_cleanup_interval", 300) * 1000
-            self.cleanup_timer.start(cleanup_interval)
-            
-        except Exception as e:
-            print(f"Error initializing GameViewWidget: {e}")
-            self.zoom_factor = 1.0
-            self.cache_path = None
-            self.storage_path = None
-
-    def perform_cleanup(self):
-        """Perform light cleanup without removing persistent data"""
-        try:
-            if config.get_config_value("resource_optimization", True):
-                # Only do memory cleanup, don't touch persistent storage
-                gc.collect()
-                print("Performed light game view cleanup (preserved login data)")
-        except Exception as e:
-            print(f"Error during game view cleanup: {e}")
-
-    def on_load_finished(self, ok: bool):
-        """Handle page load completion"""
-        if ok:
-            print("✅ Game page loaded successfully with persistent storage.")
-            try:
-                self.setZoomFactor(self.zoom_factor)
-                QTimer.singleShot(250, self.inject_screenshot_hook)
-            except Exception as e:
-                print(f"Error setting zoom factor: {e}")
-        else:
-            print("❌ Failed to load game page.")
-
-    def wheelEvent(self, event):
-        """Handle mouse wheel events for zooming"""
-        try:
-            # Hotkey: Ctrl+Shift+S for screenshot
+            # QWebEnginePage has no setView() in PyQt6; binding to the view is done via setPage()
+            self.setPage(page)
+
+            # Store paths for cleanup (but don't delete persistent data)
+            self.cache_path = profile.cachePath()
+            self.storage_path = profile.persistentStoragePath()
+
+            # Load the game on the next event-loop tick instead of inside the
+            # constructor: Chromium starts networking and spawns the renderer
+            # process on setUrl, and deferring that lets the rest of startup
+            # (main window, themes, panels) paint first
+            self._start_url = QUrl(url)
+            QTimer.singleShot(0, self._load_start_url)
+
+            # Load zoom factor from config
+            self.zoom_factor = cfg.get("zoom_factor", 1.0)
+            self.setZoomFactor(self.zoom_factor)
+
+            # Debounced zoom persistence: zoom changes apply immediately but
+            # the config write only happens once a burst settles
+            self._zoom_save_timer = QTimer(self)
+            self._zoom_save_timer.setSingleShot(True)
+            self._zoom_save_timer.setInterval(500)
+            self._zoom_save_timer.timeout.connect(self._flush_zoom)
+
+            # Click-log lines queue in memory and hit disk in one append per
+            # flush interval rather than one open/write/close per batch
+            if self.click_logging_enabled and self.click_log_to_file:
+                self._click_log_timer = QTimer(self)
+                self._click_log_timer.setInterval(250)
+                self._click_log_timer.timeout.connect(self._flush_click_log)
+                self._click_log_timer.start()
+
+            # Install the combined bootstrap script (console filter,
+            # screenshot hook, and click logger when enabled) on all frames
+            self.install_boot_script()
+
+            # Connect signals
+            self.page().loadFinished.connect(self.on_load_finished)
             try:
-                if getattr(self, 'screenshot_hotkey_enabled', True):
-                    mods = event.modifiers()
-                    if (mods & Qt.KeyboardModifier.ControlModifier) and (mods & Qt.KeyboardModifier.ShiftModifier) and event.key() == Qt.Key.Key_S:
-                        self.handle_screenshot_request()
-                        event.accept()
-                        return
+                self.urlChanged.connect(self._on_url_changed)
             except Exception:
                 pass
+            
+            # Enable focus for keyboard events
+            self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+            
+            # Worker pool for screenshot disk writes so they never block the
+            # GUI thread
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='lc-screenshot')
+            self._screenshot_saved.connect(self._show_screenshot_toast)
+
+            # Opt-in console echo for debugging; production builds skip the
+            # buffer and timer entirely
+            if cfg.get("js_console_echo", False):
+                page.set_console_echo(True, self._io_pool)
+
+            # Setup cleanup timer (but preserve persistent data). When
+            # resource optimization is disabled the timer isn't even
+            # allocated, so there are no periodic wakeups at all.
+            if self._resource_opt:
+                self._last_gc_gen2 = _gen2_size()
+                self._last_gc_time = time.monotonic()
+                self.cleanup_timer = QTimer(self)
+                self.cleanup_timer.timeout.connect(self.perform_cleanup)
+                cleanup_interval = cfg.get("cache_cleanup_interval", 600) * 1000
+                self.cleanup_timer.start(cleanup_interval)
+            
+        except Exception as e:
+            logger.warning("Error initializing GameViewWidget: %s", e)
+
+    def _load_start_url(self):
+        """Kick off the initial page load, deferred from __init__."""
+        if self._start_url is not None:
+            self.setUrl(self._start_url)
+
+    def perform_cleanup(self):
+        """Perform light cleanup without removing persistent data"""
+        try:
+            if self._resource_opt:
+                # Only collect when the old generation has actually grown since
+                # the last sweep (or we've waited long enough); otherwise the
+                # automatic generational GC is already keeping up. Walking
+                # gen-2 isn't free, but at the cleanup-timer cadence it's far
+                # cheaper than an unconditional full collect.
+                gen2 = _gen2_size()
+                now = time.monotonic()
+                if (gen2 - self._last_gc_gen2 > _GC_GEN2_GROWTH_THRESHOLD or
+                        now - self._last_gc_time > _GC_MAX_WAIT_SECONDS):
+                    gc.collect(2)
+                    self._last_gc_gen2 = _gen2_size()
+                    self._last_gc_time = now
+                    logger.debug("Performed light game view cleanup (preserved login data)")
+        except Exception as e:
+            logger.warning("Error during game view cleanup: %s", e)
+
+    def on_load_finished(self, ok: bool):
+        """Handle page load completion"""
+        if ok:
+            logger.debug("Game page loaded successfully with persistent storage.")
+            try:
+                self.setZoomFactor(self.zoom_factor)
+            except Exception as e:
+                logger.warning("Error setting zoom factor: %s", e)
+        else:
+            logger.warning("Failed to load game page.")
+
+    def setZoomFactor(self, factor):
+        """Push zoom to the engine only when it differs from the applied value.
+
+        Skipping the redundant case avoids a Chromium IPC round-trip and
+        relayout, e.g. when on_load_finished re-applies an unchanged zoom.
+        """
+        if factor == self._applied_zoom:
+            return
+        self._applied_zoom = factor
+        super().setZoomFactor(factor)
+
+    def _apply_zoom(self, factor):
+        """Clamp, apply, and schedule persistence for a new zoom factor."""
+        factor = max(0.25, min(factor, 5.0))
+        if factor == self.zoom_factor:
+            return
+        self.zoom_factor = factor
+        self.setZoomFactor(factor)
+        if self._zoom_save_timer is not None:
+            self._zoom_save_timer.start()
+        self.zoom_changed.emit(factor)
+
+    def _flush_zoom(self):
+        """Persist the latest zoom factor once a zoom burst has settled."""
+        try:
+            config.set_config_value("zoom_factor", self.zoom_factor)
+        except Exception as e:
+            logger.warning("Error saving zoom factor: %s", e)
+
+    def wheelEvent(self, event):
+        """Handle mouse wheel events for zooming"""
+        if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+            delta = event.angleDelta().y()
+            zoom_step = 0.1
+            self._apply_zoom(self.zoom_factor + (zoom_step if delta > 0 else -zoom_step))
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def keyPressEvent(self, event):
+        """Handle keyboard shortcuts"""
+        # Block navigation keys while on the game client
+        if self._nav_locked:
+            if (event.key() in (getattr(Qt.Key, 'Key_Back', None), getattr(Qt.Key, 'Key_Backspace', None)) or
+                (event.modifiers() & Qt.KeyboardModifier.AltModifier and event.key() == Qt.Key.Key_Left)):
+                event.accept()
+                return
+
+        mods = event.modifiers()
 
-            if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                delta = event.angleDelta().y()
-                zoom_step = 0.1
-                
-                if delta > 0:
-                    self.zoom_factor += zoom_step
-                else:
-                    self.zoom_factor -= zoom_step
-                    
-                # Clamp zoom factor
-                self.zoom_factor = max(0.25, min(self.zoom_factor, 5.0))
-                
-                # Apply and save zoom
-                self.setZoomFactor(self.zoom_factor)
-                config.set_config_value("zoom_factor", self.zoom_factor)
-                self.zoom_changed.emit(self.zoom_factor)
-                
-                event.accept()
-            else:
-                super().wheelEvent(event)
-        except Exception as e:
-            print(f"Error in wheelEvent: {e}")
-            super().wheelEvent(event)
-
-    def keyPressEvent(self, event):
-        """Handle keyboard shortcuts"""
-        try:
-            # Block navigation keys while on the game client
-            try:
-                if self._should_block_navigation_buttons():
-                    if (event.key() in (getattr(Qt.Key, 'Key_Back', None), getattr(Qt.Key, 'Key_Backspace', None)) or
-                        (event.modifiers() & Qt.KeyboardModifier.AltModifier and event.key() == Qt.Key.Key_Left)):
-                        event.accept()
-                        return
-            except Exception:
-                pass
-
-            if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                if event.key() == Qt.Key.Key_0:
-                    # Ctrl+0: Reset zoom to 100%
-                    self.zoom_factor = 1.0
-                    self.setZoomFactor(self.zoom_factor)
-                    config.set_config_value("zoom_factor", self.zoom_factor)
-                    self.zoom_changed.emit(self.zoom_factor)
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key.Key_Plus or event.key() == Qt.Key.Key_Equal:
-                    # Ctrl++: Zoom in
-                    self.zoom_factor = min(self.zoom_factor + 0.1, 5.0)
-                    self.setZoomFactor(self.zoom_factor)
-                    config.set_config_value("zoom_factor", self.zoom_factor)
-                    self.zoom_changed.emit(self.zoom_factor)
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key.Key_Minus:
-                    # Ctrl+-: Zoom out
-                    self.zoom_factor = max(self.zoom_factor - 0.1, 0.25)
-                    self.setZoomFactor(self.zoom_factor)
-                    config.set_config_value("zoom_factor", self.zoom_factor)
-                    self.zoom_changed.emit(self.zoom_factor)
-                    event.accept()
-                    return
-            
-            super().keyPressEvent(event)
-        except Exception as e:
-            print(f"Error in keyPressEvent: {e}")
-            super().keyPressEvent(event)
-
-    def keyReleaseEvent(self, event):
-        """Also block navigation key releases to avoid fallback handling."""
-        try:
-            if self._should_block_navigation_buttons():
-                if (event.key() in (getattr(Qt.Key, 'Key_Back', None), getattr(Qt.Key, 'Key_Backspace', None)) or
-                    (event.modifiers() & Qt.KeyboardModifier.AltModifier and event.key() == Qt.Key.Key_Left)):
-                    event.accept()
-                    return
-        except Exception:
-            pass
-        super().keyReleaseEvent(event)
-
-    # Intercept view-level back/forward programmatic calls
-    def back(self):
-        try:
-            if self._should_block_navigation_buttons():
-                print("Blocked view.back() while on LostCity client.")
-                return
-        except Exception:
-            pass
-        return super().back()
-
-    def forward(self):
-        try:
-            if self._should_block_navigation_buttons():
-                print("Blocked view.forward() while on LostCity client.")
-                return
-        except Exception:
-            pass
-        return super().forward()
-
-    def _apply_game_nav_lock(self):
-        """Disable back navigation and clear history when on game client."""
-        try:
-            if not self._should_block_navigation_buttons():
-                # Re-enable back action when not on client
-                try:
-                    act = self.page().action(QWebEnginePage.WebAction.Back)
-                    if act:
-                        act.setEnabled(True)
-                except Exception:
-                    pass
-                return
-            # On client: clear history and disable back action
-            try:
-                hist = self.page().history()
-                if hist:
-                    hist.clear()
-            except Exception:
-                pass
-            try:
-                act = self.page().action(QWebEnginePage.WebAction.Back)
-                if act:
-                    act.setEnabled(False)
-            except Exception:
-                pass
-        except Exception as e:
-            print(f"Error applying nav lock: {e}")
-
-    def _on_url_changed(self, qurl):
-        # Update nav lock whenever URL changes
-        try:
-            self._apply_game_nav_lock()
-        except Exception as e:
-            print(f"Error updating nav lock on URL change: {e}")
-
-    def reset_zoom(self):
-        """Reset zoom to 100%"""
-        try:
-            self.zoom_factor = 1.0
-            self.setZoomFactor(self.zoom_factor)
-            config.set_config_value("zoom_factor", self.zoom_factor)
-            self.zoom_changed.emit(self.zoom_factor)
-        except Exception as e:
-            print(f"Error resetting zoom: {e}")
-
-    def zoom_in(self):
-        """Zoom in by one step"""
-        try:
-            self.zoom_factor = min(self.zoom_factor + 0.1, 5.0)
-            self.setZoomFactor(self.zoom_factor)
-            config.set_config_value("zoom_factor", self.zoom_factor)
-            self.zoom_changed.emit(self.zoom_factor)
-        except Exception as e:
-            print(f"Error zooming in: {e}")
-
-    def zoom_out(self):
-        """Zoom out by one step"""
-        try:
-            self.zoom_factor = max(self.zoom_factor - 0.1, 0.25)
-            self.setZoomFactor(self.zoom_factor)
-            config.set_config_value("zoom_factor", self.zoom_factor)
-            self.zoom_changed.emit(self.zoom_factor)
-        except Exception as e:  # FIXED: Added 'as e' here
-            print(f"Error zooming out: {e}")
-
-    def mousePressEvent(self, event):
-        """Block navigation mouse buttons from leaving the game page."""
-        try:
-            if (self._is_navigation_mouse_button(event.button()) and
-                    self._should_block_navigation_buttons()):
-                event.accept()
-                return
-        except Exception as e:
-            print(f"Error filtering mousePressEvent: {e}")
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        """Block navigation mouse buttons from leaving the game page."""
-        try:
-            if (self._is_navigation_mouse_button(event.button()) and
-                    self._should_block_navigation_buttons()):
-                event.accept()
-                return
-        except Exception as e:
-            print(f"Error filtering mouseReleaseEvent: {e}")
-        super().mouseReleaseEvent(event)
-
-    def event(self, event):
-        """Swallow navigation side button clicks before default handling."""
-        try:
-            if event.type() in (
-                QEvent.Type.MouseButtonPress,
-                QEvent.Type.MouseButtonRelease,
-                QEvent.Type.MouseButtonDblClick,
-            ):
-                # Avoid strict isinstance to be robust across bindings
-                btn = None
-                try:
-                    # QMouseEvent has button(); other events may not
-                    btn = event.button() if hasattr(event, 'button') else None
-                except Exception:
-                    btn = None
-                if btn is not None and self._is_navigation_mouse_button(btn) and self._should_block_navigation_buttons():
-                    event.accept()
-                    return True
-        except Exception as e:
-            print(f"Error in generic event filter: {e}")
-        return super().event(event)
-
-    @staticmethod
-    def _is_navigation_mouse_button(button):
-        """Return True if the mouse button is a navigation side button."""
-        navigation_buttons = [
-            getattr(Qt.MouseButton, name, None)
-            for name in ("BackButton", "ForwardButton", "XButton1", "XButton2")
-        ]
-        navigation_buttons = [btn for btn in navigation_buttons if btn is not None]
-        return any(button == btn for btn in navigation_buttons)
-
-    def _should_block_navigation_buttons(self):
-        """Return True when the current URL matches the LostCity client."""
-        try:
-            current_url = self.page().url()
-            if not current_url.isValid():
-                return False
-            if _is_lostcity_game_client_url(current_url):
-                return True
-            return False
-        except Exception as e:
-            print(f"Error evaluating current game URL: {e}")
-            return False
-
-    def _lc_timestamp(self):
-        try:
-            if ZoneInfo is not None:
-                now = datetime.now(ZoneInfo("America/New_York"))
-            else:
-                now = datetime.now()
-            month = now.strftime("%B")
-            day = str(now.day)
-            year = str(now.year)
-            hour_12 = str(now.hour % 12 or 12)
-            minute = f"{now.minute:02d}"
-            second = f"{now.second:02d}"
-            meridiem = now.strftime("%p")
-            tz_abbr = now.tzname() or "EDT"
-            return f"{month}-{day}-{year}-{hour_12}-{minute}-{second}-{meridiem}-{tz_abbr}"
-        except Exception:
-            return datetime.now().strftime("%B-%d-%Y-%I-%M-%S-%p-EDT")
-
-    def on_download_requested(self, download):
-        """Force any game-initiated downloads (e.g., screenshots) into LCScreenshots with LC_ timestamp name."""
-        try:
-            # Determine target directory next to this file (repo root)
-            target_dir = Path(__file__).resolve().parent / "LCScreenshots"
-            target_dir.mkdir(parents=True, exist_ok=True)
-
-            # Best-effort read suggested name and extension across Qt versions
-            suggested = None
-            try:
-                # Qt6: method downloadFileName() may be a function
-                suggested = download.downloadFileName() if callable(getattr(download, 'downloadFileName', None)) else getattr(download, 'downloadFileName', None)
-            except Exception:
-                pass
-            if not suggested:
-                try:
-                    suggested = download.path() if callable(getattr(download, 'path', None)) else getattr(download, 'path', None)
-                except Exception:
-                    suggested = None
-            if not suggested:
-                try:
-                    suggested = download.url().fileName()  # fallback
-                except Exception:
-                    suggested = None
-
-            # Normalize extension
-            ext = ".png"
-            try:
-                if suggested:
-                    base = os.path.basename(str(suggested))
-                    suffix = os.path.splitext(base)[1]
-                    if suffix:
-                        ext = suffix
-            except Exception:
-                pass
-
-            filename = f"LC_{self._lc_timestamp()}{ext}"
-
-            # Apply target path according to available API
-            applied = False
-            try:
-                if hasattr(download, 'setDownloadDirectory') and hasattr(download, 'setDownloadFileName'):
-                    download.setDownloadDirectory(str(target_dir))
-                    download.setDownloadFileName(filename)
-                    download.accept()
-                    applied = True
-            except Exception as e:
-                print(f"Download API (Qt6) failed: {e}")
-
-            if not applied:
-                try:
-                    # PyQt5 style
-                    full_path = target_dir / filename
-                    if hasattr(download, 'setPath'):
-                        download.setPath(str(full_path))
-                        download.accept()
-                        applied = True
-                except Exception as e:
-                    print(f"Download API (Qt5) failed: {e}")
-
-            if applied:
-                print(f"Redirected download to {target_dir} as {filename}")
+        # Hotkey: Ctrl+Shift+S for screenshot
+        if (self.screenshot_hotkey_enabled and
+                (mods & Qt.KeyboardModifier.ControlModifier) and
+                (mods & Qt.KeyboardModifier.ShiftModifier) and
+                event.key() == Qt.Key.Key_S):
+            self.handle_screenshot_request()
+            event.accept()
+            return
+
+        if mods == Qt.KeyboardModifier.ControlModifier:
+            if event.key() == Qt.Key.Key_0:
+                # Ctrl+0: Reset zoom to 100%
+                self._apply_zoom(1.0)
+                event.accept()
+                return
+            elif event.key() == Qt.Key.Key_Plus or event.key() == Qt.Key.Key_Equal:
+                # Ctrl++: Zoom in
+                self._apply_zoom(self.zoom_factor + 0.1)
+                event.accept()
+                return
+            elif event.key() == Qt.Key.Key_Minus:
+                # Ctrl+-: Zoom out
+                self._apply_zoom(self.zoom_factor - 0.1)
+                event.accept()
+                return
+
+        super().keyPressEvent(event)
+
+    def keyReleaseEvent(self, event):
+        """Also block navigation key releases to avoid fallback handling."""
+        if self._nav_locked:
+            if (event.key() in (getattr(Qt.Key, 'Key_Back', None), getattr(Qt.Key, 'Key_Backspace', None)) or
+                (event.modifiers() & Qt.KeyboardModifier.AltModifier and event.key() == Qt.Key.Key_Left)):
+                event.accept()
+                return
+        super().keyReleaseEvent(event)
+
+    # Intercept view-level back/forward programmatic calls
+    def back(self):
+        if self._nav_locked:
+            logger.debug("Blocked view.back() while on LostCity client.")
+            return
+        return super().back()
+
+    def forward(self):
+        if self._nav_locked:
+            logger.debug("Blocked view.forward() while on LostCity client.")
+            return
+        return super().forward()
+
+    def _apply_game_nav_lock(self):
+        """Disable back navigation and clear history when on game client."""
+        try:
+            if not self._nav_locked:
+                # Re-enable back action when not on client
                 try:
-                    self._show_screenshot_toast(str(target_dir / filename))
+                    act = self.page().action(QWebEnginePage.WebAction.Back)
+                    if act:
+                        act.setEnabled(True)
                 except Exception:
                     pass
-            else:
-                print("Could not apply download redirection; download may go to default location.")
-        except Exception as e:
-            print(f"Error in on_download_requested: {e}")
-
-    def handle_screenshot_request(self):
-        """Capture the canvas directly and save to LCScreenshots."""
-        try:
-            self.capture_canvas_to_file()
-        except Exception as e:
-            print(f"Error handling screenshot request: {e}")
-
-    def capture_canvas_to_file(self):
-        """Capture the in-page canvas via toDataURL and write a PNG file."""
-        try:
-            script = """
-                (function(){
-                    function findCanvas(win) {
-                        try {
-                            var d = win.document;
-                            var c = d && d.getElementById ? d.getElementById('canvas') : null;
-                            if (c) return c;
-                            if (!win.frames) return null;
-                            for (var i=0;i<win.frames.length;i++) {
-                                try {
-                                    var r = findCanvas(win.frames[i]);
-                                    if (r) return r;
-                                } catch (e) {}
-                            }
-                            return null;
-                        } catch (e) {
-                            return null;
-                        }
-                    }
-                    try {
-                        var c = findCanvas(window);
-                        if (!c) { return '__ERR__:no-canvas'; }
-                        var data = c.toDataURL('image/png');
-                        if (!data || typeof data !== 'string' || data.indexOf('data:') !== 0) {
-                            return '__ERR__:no-dataurl';
-                        }
-                        return data;
-                    } catch (e) {
-                        return '__ERR__:'+ (e && e.toString ? e.toString() : 'unknown');
-                    }
-                })();
-            """
-            def _cb(result):
-                try:
-                    if not isinstance(result, str):
-                        print('Screenshot JS result invalid; falling back to view.grab')
-                        return self._fallback_grab_to_file()
-                    if result.startswith('__ERR__:'):
-                        print('Canvas screenshot error:', result)
-                        return self._fallback_grab_to_file()
-                    # Parse data URL
-                    prefix = 'base64,'
-                    idx = result.find(prefix)
-                    if idx == -1:
-                        print('No base64 in data URL; falling back to view.grab')
-                        return self._fallback_grab_to_file()
-                    b64 = result[idx+len(prefix):]
-                    data = base64.b64decode(b64)
-                    # Ensure dir
-                    target_dir = Path(__file__).resolve().parent / 'LCScreenshots'
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    # Name
-                    ts = self._lc_timestamp() if hasattr(self, '_lc_timestamp') else 'capture'
-                    filename = f'LC_{ts}.png'
-                    out_path = target_dir / filename
-                    with open(out_path, 'wb') as f:
-                        f.write(data)
-                    print(f'Canvas screenshot saved to {out_path}')
-                    try:
-                        self._show_screenshot_toast(str(out_path))
-                    except Exception:
-                        pass
-                except Exception as e:
-                    print('Error writing canvas screenshot:', e)
-                    self._fallback_grab_to_file()
-
-            self.page().runJavaScript(script, _cb)
-        except Exception as e:
-            print(f'Error starting canvas capture: {e}')
-            self._fallback_grab_to_file()
-
-    def _fallback_grab_to_file(self):
-        try:
-            pm = self.grab()
-            if pm.isNull():
-                print('Fallback grab failed: pixmap is null')
-                return
-            target_dir = Path(__file__).resolve().parent / 'LCScreenshots'
-            target_dir.mkdir(parents=True, exist_ok=True)
-            ts = self._lc_timestamp() if hasattr(self, '_lc_timestamp') else 'capture'
-            out_path = target_dir / f'LC_{ts}.png'
-            if pm.save(str(out_path), 'PNG'):
-                print(f'Fallback view.grab screenshot saved to {out_path}')
+                return
+            # On client: clear history and disable back action
+            try:
+                hist = self.page().history()
+                if hist:
+                    hist.clear()
+            except Exception:
+                pass
+            try:
+                act = self.page().action(QWebEnginePage.WebAction.Back)
+                if act:
+                    act.setEnabled(False)
+            except Exception:
+                pass
+        except Exception as e:
+            logger.warning("Error applying nav lock: %s", e)
+
+    def _on_url_changed(self, qurl):
+        # Recompute cached nav-lock state and re-apply it on URL changes;
+        # Qt can re-emit the same URL (fragment-only changes, reloads), so
+        # skip the recompute when nothing actually changed
+        try:
+            url_str = qurl.toString()
+            if url_str == self._last_seen_url:
+                return
+            self._last_seen_url = url_str
+            self._nav_locked = qurl.isValid() and _is_lostcity_game_client_url(qurl)
+            self._apply_game_nav_lock()
+        except Exception as e:
+            logger.warning("Error updating nav lock on URL change: %s", e)
+
+    def reset_zoom(self):
+        """Reset zoom to 100%"""
+        self._apply_zoom(1.0)
+
+    def zoom_in(self):
+        """Zoom in by one step"""
+        self._apply_zoom(self.zoom_factor + 0.1)
+
+    def zoom_out(self):
+        """Zoom out by one step"""
+        self._apply_zoom(self.zoom_factor - 0.1)
+
+    def mousePressEvent(self, event):
+        """Block navigation mouse buttons from leaving the game page."""
+        if event.button() in _NAV_BUTTONS and self._nav_locked:
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Block navigation mouse buttons from leaving the game page."""
+        if event.button() in _NAV_BUTTONS and self._nav_locked:
+            event.accept()
+            return
+        super().mouseReleaseEvent(event)
+
+    # Precomputed at class scope so the per-event filter below is one
+    # attribute read plus a frozenset lookup instead of a tuple build;
+    # event() sees every event Qt delivers (paints, moves, timers, ...)
+    _MOUSE_BTN_EVENTS = frozenset((
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseButtonRelease,
+        QEvent.Type.MouseButtonDblClick,
+    ))
+
+    def event(self, event):
+        """Swallow navigation side button clicks before default handling."""
+        if not self._nav_locked or event.type() not in self._MOUSE_BTN_EVENTS:
+            return super().event(event)
+        if event.button() in _NAV_BUTTONS:
+            event.accept()
+            return True
+        return super().event(event)
+
+    def handle_screenshot_request(self):
+        """Capture the canvas directly and save to LCScreenshots."""
+        try:
+            self.capture_canvas_to_file()
+        except Exception as e:
+            logger.warning("Error handling screenshot request: %s", e)
+
+    def capture_canvas_to_file(self):
+        """Capture the in-page canvas via toDataURL and write a PNG file."""
+        try:
+            def _cb(result):
                 try:
-                    self._show_screenshot_toast(str(out_path))
-                except Exception:
-                    pass
-            else:
-                print('Fallback view.grab save failed')
+                    if not isinstance(result, str):
+                        logger.warning('Screenshot JS result invalid; falling back to view.grab')
+                        return self._fallback_grab_to_file()
+                    if result.startswith('__ERR__:'):
+                        logger.warning('Canvas screenshot error: %s', result)
+                        return self._fallback_grab_to_file()
+                    # Parse data URL; partition scans and slices in one C call
+                    b64 = result.partition('base64,')[2]
+                    if not b64:
+                        logger.warning('No base64 in data URL; falling back to view.grab')
+                        return self._fallback_grab_to_file()
+                    # Name
+                    ts = _lc_timestamp()
+                    out_path = _SCREENSHOTS_DIR / f'LC_{ts}.png'
+                    # Hand the still-encoded payload to the worker: decoding
+                    # a megabyte-scale PNG here would stall the render loop
+                    self._io_pool.submit(self._write_screenshot_b64, b64, out_path)
+                except Exception as e:
+                    logger.warning('Error writing canvas screenshot: %s', e)
+                    self._fallback_grab_to_file()
+
+            # The boot script caches the canvas (publishing it to the top
+            # window from same-origin subframes), so the per-capture JS is
+            # the small constant one-line lookup
+            self.page().runJavaScript(_CANVAS_CAPTURE_JS, _cb)
+        except Exception as e:
+            logger.warning('Error starting canvas capture: %s', e)
+            self._fallback_grab_to_file()
+
+    def _write_screenshot_b64(self, b64, out_path):
+        """Decode and write a base64 screenshot payload on a worker thread.
+
+        Goes through a temp file plus os.replace so a crash mid-write can't
+        leave a truncated PNG behind.
+        """
+        try:
+            # Qt's base64 decoder and file writer run in C++; the Python
+            # base64 module re-materializes the payload as interpreter-level
+            # bytes first
+            data = QByteArray.fromBase64(b64.encode('ascii'))
+            tmp_path = out_path.with_suffix(out_path.suffix + '.tmp')
+            qf = QFile(str(tmp_path))
+            if not qf.open(QFile.OpenModeFlag.WriteOnly):
+                raise OSError(f'could not open {tmp_path} for writing')
+            qf.write(data)
+            qf.close()
+            os.replace(tmp_path, out_path)
+            logger.debug('Canvas screenshot saved to %s', out_path)
+            self._screenshot_saved.emit(str(out_path))
+        except Exception as e:
+            logger.warning('Error writing canvas screenshot: %s', e)
+
+    def _fallback_grab_to_file(self):
+        try:
+            pm = self.grab()
+            if pm.isNull():
+                logger.warning('Fallback grab failed: pixmap is null')
+                return
+            ts = _lc_timestamp()
+            out_path = _SCREENSHOTS_DIR / f'LC_{ts}.png'
+            # Detach a QImage copy and let the worker run the PNG deflate;
+            # encoding a full-window frame takes tens of milliseconds
+            img = pm.toImage().copy()
+            if self._io_pool is not None:
+                self._io_pool.submit(self._write_screenshot_image, img, out_path)
+            else:
+                self._write_screenshot_image(img, out_path)
+        except Exception as e:
+            logger.warning('Error in fallback grab: %s', e)
+
+    def _write_screenshot_image(self, img, out_path):
+        """Encode and write a grabbed frame on a worker thread."""
+        try:
+            tmp_path = out_path.with_suffix(out_path.suffix + '.tmp')
+            if not img.save(str(tmp_path), 'PNG'):
+                logger.warning('Fallback view.grab save failed')
+                return
+            os.replace(tmp_path, out_path)
+            logger.debug('Fallback view.grab screenshot saved to %s', out_path)
+            self._screenshot_saved.emit(str(out_path))
         except Exception as e:
-            print('Error in fallback grab:', e)
+            logger.warning('Error writing fallback screenshot: %s', e)
 
     def _show_screenshot_toast(self, path_str):
         try:
-            if not getattr(self, 'screenshot_toast_enabled', True):
+            if not self.screenshot_toast_enabled:
                 return
             msg = f"Screenshot saved\n{path_str}"
             pos = QCursor.pos()
-            ms = getattr(self, 'screenshot_toast_ms', 2000)
-            QToolTip.showText(pos, msg, self, self.rect(), ms)
+            QToolTip.showText(pos, msg, self, self.rect(), self.screenshot_toast_ms)
         except Exception:
             pass
-
-    def inject_screenshot_hook(self):
-        """Inject JavaScript that routes the in-game Take screenshot link to LostKit."""
-        if not self._should_block_navigation_buttons():
-            return
-        print("Injecting screenshot hook into game page…")
-        script = """
-            (function() {
-                const CUSTOM_URL = 'lostkit://take-screenshot';
-
-                function triggerLostKit() {
-                    try { window.location.href = CUSTOM_URL; } catch (err) {}
-                }
-
-                function attachTo(el) {
-                    if (!el || el.__lostkitScreenshotAttached) { return false; }
-                    function handler(ev) {
-                        try { ev.preventDefault(); } catch (e) {}
-                        try { ev.stopPropagation(); } catch (e) {}
-                        try { ev.stopImmediatePropagation(); } catch (e) {}
-                        triggerLostKit();
-                        return false;
-                    }
-                    el.addEventListener('click', handler, true);
-                    try { el.onclick = handler; } catch (e) {}
-                    try { el.setAttribute('href', CUSTOM_URL); } catch (e) {}
-                    el.__lostkitScreenshotAttached = true;
-                    return true;
-                }
-
-                function attachById() {
-                    return attachTo(document.getElementById('screenshot'));
-                }
-
-                function attachByText() {
-                    const nodes = Array.from(document.querySelectorAll('a,button,span,div'));
-                    for (const el of nodes) {
-                        try {
-                            if (!el || !el.textContent) continue;
-                            if (el.textContent.trim().toLowerCase() === 'take screenshot') {
-                                if (attachTo(el)) return true;
-                            }
-                        } catch (e) {}
-                    }
-                    return false;
-                }
-
-                function attachByOnClick() {
-                    const nodes = Array.from(document.querySelectorAll('[onclick]'));
-                    for (const el of nodes) {
-                        try {
-                            const val = String(el.getAttribute('onclick')||'').toLowerCase();
-                            if (val.indexOf('savescreenshot') !== -1) {
-                                if (attachTo(el)) return true;
-                            }
-                        } catch (e) {}
-                    }
-                    return false;
-                }
-
-                function overrideSaveScreenshot() {
-                    try {
-                        const original = window.saveScreenshot;
-                        window.saveScreenshot = function() { triggerLostKit(); return undefined; };
-                        window.saveScreenshot.__lostkitWrapped = true;
-                    } catch (e) {}
-                }
-
-                function overrideCandidates() {
-                    ['takeScreenshot','take_screenshot','TakeScreenshot'].forEach(function(name){
-                        try { window[name] = function(){ triggerLostKit(); return undefined; }; } catch (e) {}
-                    });
-                }
-
-                function install() {
-                    overrideSaveScreenshot();
-                    overrideCandidates();
-                    if (attachById()) return;
-                    if (attachByText()) return;
-                    attachByOnClick();
-                }
-
-                if (document.readyState === 'loading') {
-                    document.addEventListener('DOMContentLoaded', install);
-                } else {
-                    install();
-                }
-
-                try {
-                    var ELEMENT_NODE = (window.Node && Node.ELEMENT_NODE) || 1;
-                    const obs = new MutationObserver(function(muts){
-                        let attached = false;
-                        for (const m of muts) {
-                            for (const n of m.addedNodes) {
-                                if ((n.nodeType||ELEMENT_NODE) === ELEMENT_NODE) {
-                                    if (attachById() || attachByText() || attachByOnClick()) { attached = true; break; }
-                                }
-                            }
-                            if (attached) break;
-                        }
-                        overrideSaveScreenshot();
-                        overrideCandidates();
-                    });
-                    obs.observe(document.documentElement||document.body, {childList:true,subtree:true});
-                } catch (e) {}
-            })();
-        """
-        try:
-            self.page().runJavaScript(script)
-        except Exception as e:
-            print(f"Error injecting screenshot hook: {e}")
-
-    def install_screenshot_script(self):
-        """Register a QWebEngineScript so hooks run on subframes too."""
-        try:
-            print("Installing persistent screenshot hook script (subframes enabled)…")
-            script = QWebEngineScript()
-            script.setName("LostKitScreenshotHook")
-            script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
-            script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
-            script.setRunsOnSubFrames(True)
-            script.setSourceCode(
-                """
-                (function() {
-                    const CUSTOM_URL = 'lostkit://take-screenshot';
-                    function triggerLostKit() {
-                        try { window.location.href = CUSTOM_URL; } catch (err) {}
-                    }
-                    function attachTo(el) {
-                        if (!el || el.__lostkitScreenshotAttached) { return; }
-                        function handler(ev) {
-                            try { ev.preventDefault(); } catch (e) {}
-                            try { ev.stopPropagation(); } catch (e) {}
-                            try { ev.stopImmediatePropagation(); } catch (e) {}
-                            triggerLostKit();
-                            return false;
-                        }
-                        el.addEventListener('click', handler, true);
-                        try { el.onclick = handler; } catch (e) {}
-                        try { el.setAttribute('href', CUSTOM_URL); } catch (e) {}
-                        el.__lostkitScreenshotAttached = true;
-                    }
-                    function install() {
-                        try { if (document.getElementById('screenshot')) attachTo(document.getElementById('screenshot')); } catch (e) {}
-                        try {
-                            const nodes = Array.from(document.querySelectorAll('[onclick]'));
-                            for (const el of nodes) {
-                                try { const v = String(el.getAttribute('onclick')||'').toLowerCase(); if (v.indexOf('savescreenshot') !== -1) { attachTo(el); break; } } catch (e) {}
-                            }
-                        } catch (e) {}
-                    }
-                    if (document.readyState === 'loading') {
-                        document.addEventListener('DOMContentLoaded', install);
-                    } else {
-                        install();
-                    }
-                    try {
-                        var ELEMENT_NODE = (window.Node && Node.ELEMENT_NODE) || 1;
-                        const obs = new MutationObserver(function(muts){
-                            for (const m of muts) {
-                                for (const n of m.addedNodes) {
-                                    if ((n.nodeType||ELEMENT_NODE) === ELEMENT_NODE) {
-                                        if ((n.id && n.id==='controls') || (n.querySelector && n.querySelector('#screenshot'))) {
-                                            install();
-                                            return;
-                                        }
-                                    }
-                                }
-                            }
-                        });
-                        obs.observe(document.documentElement||document.body,{childList:true,subtree:true});
-                    } catch (e) {}
-                })();
-                """
-            )
-            # Insert script (avoid iteration; PyQt6 scripts collection may not be iterable)
-            scripts = self.page().scripts()
-            try:
-                if hasattr(scripts, 'findScript'):
-                    existing = scripts.findScript("LostKitScreenshotHook")
-                    try:
-                        # Remove existing to ensure a single copy
-                        if existing and getattr(existing, 'name', None) and existing.name() == "LostKitScreenshotHook":
-                            scripts.remove(existing)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            scripts.insert(script)
-        except Exception as e:
-            print(f"Error installing screenshot script: {e}")
-
-    def get_zoom_percentage(self):
-        """Get current zoom as percentage string"""
-        try:
-            return f"{int(self.zoom_factor * 100)}%"
-        except Exception:
-            return "100%"
-
-    def cleanup_cache_files(self):
-        """Light cleanup - preserve persistent login data"""
-        print("Game view cleanup: Preserving login data and cookies")
-        # Don't delete persistent storage directories
-        # They contain login sessions and should survive restarts
-
-    def closeEvent(self, event):
-        """Clean up when widget is closed - preserve login data"""
-        if hasattr(self, 'cleanup_timer'):
-            self.cleanup_timer.stop()
-            
-        # Don't clear persistent storage - just clean up memory
-        gc.collect()
-        print("Game view closed - login data preserved")
-        
-        super().closeEvent(event)
-
+
+    def install_boot_script(self):
+        """Install the injected page scripts on the shared profile.
+
+        The console filter and screenshot hook ship as one MainWorld script
+        (one V8 compile per frame; both need the page's own console.log and
+        window.saveScreenshot). The click logger only touches the DOM and
+        its own console.log, so it runs isolated in ApplicationWorld where
+        its listeners and batching buffers can't collide with - or be
+        tampered with by - page script. Console messages from every world
+        reach javaScriptConsoleMessage, so the '@@CLICK@@' pipeline is
+        unchanged.
+        """
+        try:
+            # Install on the profile's collection so the scripts outlive any
+            # single page/view. A second view on the shared profile finds
+            # them already present and returns without the remove+insert
+            # churn that would force the renderer to re-register them.
+            scripts = self.page().profile().scripts()
+            if not scripts.findScript("LostKitBoot").isNull():
+                return
+            boot = QWebEngineScript()
+            boot.setName("LostKitBoot")
+            boot.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+            boot.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+            boot.setRunsOnSubFrames(True)
+            boot.setSourceCode(_CONSOLE_FILTER_JS + _SCREENSHOT_HOOK_JS)
+            scripts.insert(boot)
+            if self.click_logging_enabled:
+                clicks = QWebEngineScript()
+                clicks.setName("LostKitClickLogger")
+                clicks.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+                clicks.setWorldId(QWebEngineScript.ScriptWorldId.ApplicationWorld)
+                clicks.setRunsOnSubFrames(True)
+                clicks.setSourceCode(_CLICK_LOGGER_JS)
+                scripts.insert(clicks)
+        except Exception as e:
+            logger.warning("Error installing boot script: %s", e)
+
+    def get_zoom_percentage(self):
+        """Get current zoom as percentage string.
+
+        Status-bar refreshes call this several times a second. The cache is
+        keyed on the factor itself rather than invalidated by _apply_zoom,
+        because main_window also writes zoom_factor directly when restoring
+        the saved zoom; the common case is one tuple compare.
+        """
+        try:
+            zf = self.zoom_factor
+            cached = self._zoom_cache
+            if cached[0] == zf:
+                return cached[1]
+            pct = f"{int(zf * 100)}%"
+            self._zoom_cache = (zf, pct)
+            return pct
+        except Exception:
+            return "100%"
+
+    def cleanup_cache_files(self):
+        """Light cleanup - preserve persistent login data"""
+        logger.debug("Game view cleanup: Preserving login data and cookies")
+        # Don't delete persistent storage directories
+        # They contain login sessions and should survive restarts
+
+    def closeEvent(self, event):
+        """Clean up when widget is closed - preserve login data"""
+        if self.cleanup_timer is not None:
+            self.cleanup_timer.stop()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+        # Flush a pending debounced zoom save so the last value isn't lost
+        if self._zoom_save_timer is not None and self._zoom_save_timer.isActive():
+            self._zoom_save_timer.stop()
+            self._flush_zoom()
+        # Likewise drain any queued click-log lines and release the fd
+        if self._click_log_timer is not None:
+            self._click_log_timer.stop()
+        self._flush_click_log()
+        if self._click_log_fd is not None:
+            try:
+                os.close(self._click_log_fd)
+            except Exception:
+                pass
+            self._click_log_fd = None
+            
+        # Don't clear persistent storage; Qt object teardown plus normal
+        # refcounting reclaims the widget's memory without a forced collect
+        logger.debug("Game view closed - login data preserved")
+        
+        super().closeEvent(event)
+
+    def set_click_logging_enabled(self, enabled):
+        """Toggle the in-page click logger without reinstalling the script."""
+        self.click_logging_enabled = bool(enabled)
+        try:
+            flag = 'true' if self.click_logging_enabled else 'false'
+            # The logger lives in ApplicationWorld, so the flag must be set
+            # in that world; the MainWorld window object is a different one.
+            self.page().runJavaScript(
+                f'window.__lostkitClickLogEnabled = {flag};',
+                QWebEngineScript.ScriptWorldId.ApplicationWorld,
+            )
+        except Exception as e:
+            logger.warning("Error toggling click logging: %s", e)
+
     def _handle_click_log(self, json_text: str):
-        """Append click-log JSON line to logs/clicks.jsonl and echo to console."""
+        """Append a batch of click-log entries to logs/clicks.jsonl.
+
+        The injected logger batches clicks over a 250 ms window and sends
+        one JSON array per batch, so this unpacks N entries per IPC hop and
+        writes them as individual JSONL lines in a single file append.
+        """
         try:
-            if not getattr(self, 'click_log_to_file', True):
-                print(f"CLICK {json_text}")
+            entries = json.loads(json_text)
+        except Exception as e:
+            logger.warning("Error parsing click log payload: %s", e)
+            return
+        if isinstance(entries, dict):
+            # Single-entry payloads from older script versions
+            entries = [entries]
+        try:
+            lines = ''.join(json.dumps(entry, separators=(',', ':')) + '\n'
+                            for entry in entries)
+            if not self.click_log_to_file:
+                logger.debug("CLICK %s", lines)
                 return
-            logs_dir = Path(__file__).resolve().parent / 'logs'
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            log_path = logs_dir / 'clicks.jsonl'
-            with open(log_path, 'a', encoding='utf-8') as f:
-                f.write(json_text.strip() + '\n')
-            print(f"CLICK {json_text}")
+            # Queue for the periodic flush instead of opening the file per
+            # batch; rapid click bursts then cost a list append here
+            self._click_log_buf.append(lines)
+            if len(self._click_log_buf) >= 256:
+                self._flush_click_log()
+            logger.debug("CLICK %s", lines)
+        except Exception as e:
+            logger.warning("Error queueing click log: %s", e)
+
+    def _flush_click_log(self):
+        """Write all queued click-log lines with one os.write on a kept-open fd.
+
+        The descriptor is opened O_APPEND on first use and reused for the
+        widget's lifetime (closed in closeEvent), so a flush is a single
+        append syscall instead of an open/write/close cycle.
+        """
+        buf = self._click_log_buf
+        if not buf:
+            return
+        data = ''.join(buf).encode('utf-8')
+        del buf[:]
+        try:
+            fd = self._click_log_fd
+            if fd is None:
+                _CLICK_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+                # O_BINARY keeps the MSVCRT descriptor out of text mode on
+                # Windows, which would otherwise rewrite \n as \r\n inside
+                # the JSONL payload; the flag doesn't exist elsewhere
+                fd = os.open(str(_CLICK_LOG_PATH),
+                             os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                             | getattr(os, "O_BINARY", 0), 0o644)
+                self._click_log_fd = fd
+            os.write(fd, data)
         except Exception as e:
-            print(f"Error writing click log: {e}")
-
-    def install_click_logger_script(self):
-        """Register a script that logs every click with useful element details."""
-        try:
-            script = QWebEngineScript()
-            script.setName("LostKitClickLogger")
-            script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
-            script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
-            script.setRunsOnSubFrames(True)
-            script.setSourceCode(
-                """
-                (function(){
-                  if (window.__lostkitClickLoggerInstalled) return; 
-                  window.__lostkitClickLoggerInstalled = true;
-
-                  function isScreenshotElement(el){
-                    try {
-                      if (!el) return false;
-                      if (el.getAttribute && el.getAttribute('data-lostkit-screenshot') === '1') return true;
-                      const id = (el.id||'').toLowerCase();
-                      if (id === 'screenshot') return true;
-                      const txt = String((el.textContent||'')).trim().toLowerCase();
-                      if (txt === 'take screenshot' || txt.indexOf('screenshot') !== -1) return true;
-                      const oc = String((el.getAttribute && el.getAttribute('onclick'))||'').toLowerCase();
-                      if (oc.indexOf('savescreenshot') !== -1) return true;
-                    } catch (e) {}
-                    return false;
-                  }
-
-                  function nodeLabel(n){
-                    try {
-                      if (!n || !n.tagName) return 'UNKNOWN';
-                      let s = n.tagName.toLowerCase();
-                      if (n.id) s += '#' + n.id;
-                      if (n.className && typeof n.className === 'string') s += '.' + n.className.trim().split(/\s+/).slice(0,4).join('.');
-                      return s;
-                    } catch (e) { return 'UNKNOWN'; }
-                  }
-
-                  function buildPath(ev){
-                    try {
-                      const p = (ev.composedPath && ev.composedPath()) || [];
-                      if (p && p.length) return p.map(nodeLabel).slice(0,12);
-                    } catch (e) {}
-                    // Fallback: simple parent chain
-                    try {
-                      const arr = []; let cur = ev.target; let i=0;
-                      while (cur && i++ < 12) { arr.push(nodeLabel(cur)); cur = cur.parentNode; }
-                      return arr;
-                    } catch (e) { return []; }
-                  }
-
-                  function trim(s, n){ try { s = String(s||''); return s.length>n ? s.slice(0,n) : s; } catch(e){ return ''; } }
-
-                  document.addEventListener('click', function(ev){
-                    try {
-                      const t = ev.target;
-                      const href = (t && t.getAttribute && t.getAttribute('href')) || '';
-                      const onclick = (t && t.getAttribute && t.getAttribute('onclick')) || '';
-                      const payload = {
-                        ts: new Date().toISOString(),
-                        type: 'click',
-                        pageUrl: String(location.href||''),
-                        clientX: ev.clientX||0,
-                        clientY: ev.clientY||0,
-                        target: {
-                          tag: (t && t.tagName ? t.tagName.toLowerCase() : 'unknown'),
-                          id: (t && t.id) || '',
-                          class: (t && typeof t.className==='string' ? t.className : ''),
-                          text: trim((t && t.textContent) || '', 120),
-                          href: href || '',
-                          onclick: trim(onclick, 160)
-                        },
-                        path: buildPath(ev),
-                        isScreenshotIntent: isScreenshotElement(t)
-                      };
-                      console.log('@@CLICK@@ ' + JSON.stringify(payload));
-                    } catch (e) {
-                      try { console.log('@@CLICK@@ ' + JSON.stringify({ ts: new Date().toISOString(), err: String(e) })); } catch (ee) {}
-                    }
-                  }, true);
-                })();
-                """
-            )
-            scripts = self.page().scripts()
-            try:
-                if hasattr(scripts, 'findScript'):
-                    existing = scripts.findScript("LostKitClickLogger")
-                    try:
-                        if existing and getattr(existing, 'name', None) and existing.name() == "LostKitClickLogger":
-                            scripts.remove(existing)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            scripts.insert(script)
-        except Exception as e:
-            print(f"Error installing click logger script: {e}")
+            logger.warning("Error writing click log: %s", e)